@@ -1,11 +1,26 @@
 import os
 import json
-from typing import Dict, Any, List, Optional
+import time
+import base64
+import asyncio
+import hashlib
+import inspect
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, DecimalException
+from itertools import chain, islice
+from typing import Dict, Any, List, Literal, Optional
 import boto3
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from cachetools import TTLCache
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import HTMLResponse, Response
 
 # Initialize MCP server
 mcp = FastMCP("DynamoDB MCP Server")
@@ -20,305 +35,678 @@ middleware = [
     )
 ]
 
-# Initialize DynamoDB client
+# Shared DynamoDB client (boto3 clients are thread-safe, so one per process
+# lets every tool call reuse the same connection pool)
+_MAX_POOL_CONNECTIONS = 64
+_AWS_CREDS = dict(
+    aws_access_key_id=os.environ.get('AWS_ACCESS_KEY_ID'),
+    aws_secret_access_key=os.environ.get('AWS_SECRET_ACCESS_KEY'),
+    region_name=os.environ.get('AWS_REGION')
+)
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
 def get_dynamodb_client():
-    return boto3.client(
-        'dynamodb',
-        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-        region_name=os.getenv('AWS_REGION')
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = boto3.client(
+                    'dynamodb',
+                    **_AWS_CREDS,
+                    config=Config(
+                        max_pool_connections=_MAX_POOL_CONNECTIONS,
+                        retries={'mode': 'adaptive', 'max_attempts': 10}
+                    )
+                )
+    return _CLIENT
+
+# Worker threads for blocking boto3 calls, sized to the client's connection
+# pool so excess calls queue here rather than waiting on a free connection
+_EXECUTOR = ThreadPoolExecutor(max_workers=_MAX_POOL_CONNECTIONS, thread_name_prefix='dynamodb')
+
+async def run_blocking(fn, *args, **kwargs):
+    """Run a blocking boto3 call in a worker thread"""
+    return await asyncio.get_running_loop().run_in_executor(
+        _EXECUTOR, functools.partial(fn, *args, **kwargs)
+    )
+
+class AsyncDynamoDBClient:
+    """Awaitable facade over the shared client; each call runs in a worker thread
+    so concurrent tool calls overlap their DynamoDB round trips"""
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        async def call(*args, **kwargs):
+            return await run_blocking(method, *args, **kwargs)
+
+        setattr(self, name, call)
+        return call
+
+_ASYNC_CLIENT = None
+
+def get_async_dynamodb_client():
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None:
+        _ASYNC_CLIENT = AsyncDynamoDBClient(get_dynamodb_client())
+    return _ASYNC_CLIENT
+
+def format_client_error(e):
+    """Render a ClientError as '<Code>: <Message>'"""
+    error = e.response.get('Error', {})
+    return f"{error.get('Code', 'ClientError')}: {error.get('Message', '')}"
+
+def handle_client_errors(fn):
+    """Report DynamoDB ClientErrors from a tool handler as MCP tool errors"""
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except ClientError as e:
+            raise ToolError(format_client_error(e)) from e
+    return wrapper
+
+# Short-lived cache for read-mostly control-plane responses (list/describe),
+# keyed by (operation, bound arguments). Invalidation bumps a generation
+# counter (per key, or per operation for list_tables) so a call that was
+# already in flight does not store its stale result afterwards.
+_RESPONSE_CACHE = TTLCache(maxsize=256, ttl=30)
+_RESPONSE_CACHE_GENERATIONS = {}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+def _cache_generation(key):
+    return (_RESPONSE_CACHE_GENERATIONS.get(key[0], 0), _RESPONSE_CACHE_GENERATIONS.get(key, 0))
+
+def ttl_cached(fn=None, *, cacheable=None):
+    """Cache successful responses of a tool handler in _RESPONSE_CACHE, skipping
+    results for which `cacheable(result)` is false"""
+    if fn is None:
+        return functools.partial(ttl_cached, cacheable=cacheable)
+    # Resolve parameter names/defaults once so building a key per call is a
+    # plain tuple walk rather than a Signature.bind()
+    parameters = tuple(
+        (name, param.default) for name, param in inspect.signature(fn).parameters.items()
+    )
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        key = (fn.__name__, tuple(zip(
+            (name for name, _ in parameters),
+            args + tuple(kwargs.get(name, default) for name, default in parameters[len(args):])
+        )))
+        with _RESPONSE_CACHE_LOCK:
+            if key in _RESPONSE_CACHE:
+                return _RESPONSE_CACHE[key]
+            generation = _cache_generation(key)
+        result = await fn(*args, **kwargs)
+        if cacheable is None or cacheable(result):
+            with _RESPONSE_CACHE_LOCK:
+                if _cache_generation(key) == generation:
+                    _RESPONSE_CACHE[key] = result
+        return result
+    return wrapper
+
+def _invalidate_cache_entry(name):
+    _RESPONSE_CACHE_GENERATIONS[name] = _RESPONSE_CACHE_GENERATIONS.get(name, 0) + 1
+    _RESPONSE_CACHE.pop(name, None)
+
+def invalidate_table_cache(tableName, include_listing=False):
+    """Drop cached describe_table (and optionally list_tables) responses"""
+    with _RESPONSE_CACHE_LOCK:
+        _invalidate_cache_entry(('get_table_description', (('tableName', tableName),)))
+        if include_listing:
+            _invalidate_cache_entry('list_tables')
+            for key in [k for k in _RESPONSE_CACHE if k[0] == 'list_tables']:
+                _RESPONSE_CACHE.pop(key, None)
+
+# Parallel scans: segments per call, and segments running at once across all
+# calls. Each running segment holds an executor worker for its whole scan, so
+# the concurrency cap keeps most of the pool free for other tool calls.
+_MAX_TOTAL_SEGMENTS = 16
+_MAX_CONCURRENT_SEGMENTS = _MAX_POOL_CONNECTIONS // 8
+_SEGMENT_SEMAPHORE = asyncio.Semaphore(_MAX_CONCURRENT_SEGMENTS)
+
+async def scan_segment(params, limit, nextToken):
+    """Run one parallel-scan segment once a segment slot is free"""
+    async with _SEGMENT_SEMAPHORE:
+        return await run_blocking(paginate_all, 'scan', params, limit, nextToken)
+
+# DynamoDB batch API limits and retry policy for unprocessed entries
+_BATCH_WRITE_SIZE = 25
+_BATCH_GET_SIZE = 100
+_BATCH_MAX_ATTEMPTS = 8
+
+def chunked(iterable, size):
+    """Yield successive lists of at most `size` elements"""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+async def retry_unprocessed(call, request_items, unprocessed_field, bucket=None):
+    """Issue a batch call, resubmitting unprocessed entries with exponential backoff.
+    For batch writes, `bucket` is charged one unit per write request on every
+    submission, resubmissions included."""
+    responses = []
+    for attempt in range(_BATCH_MAX_ATTEMPTS):
+        if bucket is not None:
+            # One write unit per item (items up to 1 KB)
+            await bucket.acquire(sum(len(requests) for requests in request_items.values()))
+        response = await call(RequestItems=request_items)
+        responses.append(response)
+        request_items = response.get(unprocessed_field) or {}
+        if not request_items or attempt == _BATCH_MAX_ATTEMPTS - 1:
+            break
+        await asyncio.sleep(min(2 ** attempt * 0.05, 1.0))
+    return responses, request_items
+
+def is_table_settled(table):
+    """Check that a table and all its global secondary indexes are ACTIVE"""
+    return table.get('TableStatus') == 'ACTIVE' and all(
+        index.get('IndexStatus') == 'ACTIVE' for index in table.get('GlobalSecondaryIndexes', [])
     )
 
+# Only settled descriptions are cached, so callers polling for ACTIVE see
+# status changes immediately
+@ttl_cached(cacheable=is_table_settled)
+async def get_table_description(tableName):
+    """Fetch a table's description (cached; shared by describe_table and write throttling)"""
+    response = await get_async_dynamodb_client().describe_table(TableName=tableName)
+    return response['Table']
+
+class TokenBucket:
+    """Async token bucket refilled at `rate` tokens per second, holding at most `rate` tokens.
+
+    A request larger than the balance drives it negative and waits until it has
+    been paid back, so callers are smoothed to `rate` on average.
+    """
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens):
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+            if self.tokens < 0:
+                await asyncio.sleep(-self.tokens / self.rate)
+
+# Per-table write limiters keyed by table name, as (write capacity units, bucket)
+_WRITE_BUCKETS = {}
+
+async def get_write_bucket(tableName):
+    """Return a TokenBucket sized to the table's provisioned WCU, or None for
+    on-demand tables (or when the table cannot be described)"""
+    try:
+        table = await get_table_description(tableName)
+    except ClientError:
+        return None
+    wcu = table.get('ProvisionedThroughput', {}).get('WriteCapacityUnits', 0)
+    if table.get('BillingModeSummary', {}).get('BillingMode') == 'PAY_PER_REQUEST' or wcu <= 0:
+        return None
+    entry = _WRITE_BUCKETS.get(tableName)
+    if entry is None or entry[0] != wcu:
+        entry = _WRITE_BUCKETS[tableName] = (wcu, TokenBucket(wcu))
+    return entry[1]
+
+# Items returned by one scan/query call when the caller gives no limit
+_DEFAULT_ITEM_LIMIT = 1000
+
+def paginate_all(operation, params, limit=None, nextToken=None):
+    """Follow LastEvaluatedKey across pages of a scan/query, stopping after `limit` items
+    (_DEFAULT_ITEM_LIMIT when not given). NextToken in the result resumes where this
+    call stopped and is None once the scan/query is exhausted. Items are deserialized
+    to plain Python values as each page arrives."""
+    if limit is not None and limit < 1:
+        raise ToolError("limit must be at least 1")
+    config = {'MaxItems': limit if limit is not None else _DEFAULT_ITEM_LIMIT}
+    if nextToken:
+        config['StartingToken'] = nextToken
+    paginator = get_dynamodb_client().get_paginator(operation)
+    pages = paginator.paginate(**params, PaginationConfig=config)
+    items = []
+    scanned_count = 0
+    try:
+        for page in pages:
+            items.extend(deserialize_dynamodb_item(item) for item in page.get('Items', []))
+            scanned_count += page.get('ScannedCount', 0)
+    except ValueError as e:
+        # botocore rejects a malformed StartingToken with ValueError
+        raise ToolError(f"Invalid nextToken: {e}") from e
+    return {"Items": items, "Count": len(items), "ScannedCount": scanned_count,
+            "NextToken": pages.resume_token}
+
+def to_columnar(items):
+    """Pivot a list of items into {attribute: [value per item]}, None where an item lacks it"""
+    columns = {}
+    for index, item in enumerate(items):
+        for name, value in item.items():
+            column = columns.get(name)
+            if column is None:
+                column = columns[name] = [None] * len(items)
+            column[index] = value
+    return columns
+
+def format_items(result, format):
+    """Replace result["Items"] with result["Columns"] when columnar output is requested"""
+    if format == 'columnar':
+        result["Columns"] = to_columnar(result.pop("Items"))
+    return result
+
+class _AttributeSerializer(TypeSerializer):
+    """TypeSerializer that also accepts floats (JSON numbers arrive as float)"""
+
+    def serialize(self, value):
+        # bool is checked before numbers by TypeSerializer, so True stays BOOL;
+        # repr() is the shortest string that round-trips the float exactly
+        if isinstance(value, float):
+            value = Decimal(repr(value))
+        return super().serialize(value)
+
+class _AttributeDeserializer(TypeDeserializer):
+    """TypeDeserializer that returns JSON-safe values: numbers as int or float, or as
+    their exact digit string when a float cannot represent them (DynamoDB keeps up
+    to 38 significant digits); base64 text for binary; and lists for sets"""
+
+    def _deserialize_n(self, value):
+        number = Decimal(value)
+        if number == number.to_integral_value():
+            return int(number)
+        as_float = float(number)
+        if Decimal(repr(as_float)) == number:
+            return as_float
+        return value
+
+    def _deserialize_b(self, value):
+        return base64.b64encode(value).decode('ascii')
+
+    def _deserialize_ss(self, value):
+        return [self._deserialize_s(v) for v in value]
+
+    def _deserialize_ns(self, value):
+        return [self._deserialize_n(v) for v in value]
+
+    def _deserialize_bs(self, value):
+        return [self._deserialize_b(v) for v in value]
+
+_SERIALIZER = _AttributeSerializer()
+_DESERIALIZER = _AttributeDeserializer()
+
+# AttributeValue type descriptors, used to pass already-serialized expression
+# values through
+_ATTRIBUTE_VALUE_TYPES = frozenset(('S', 'N', 'B', 'BOOL', 'L', 'M', 'NULL', 'SS', 'NS', 'BS'))
+
+def is_attribute_value(value):
+    """Check whether a value is already in DynamoDB AttributeValue form, e.g. {'S': 'x'}"""
+    return isinstance(value, dict) and len(value) == 1 and next(iter(value)) in _ATTRIBUTE_VALUE_TYPES
+
+def serialize_attribute(name, value):
+    """Serialize one top-level attribute, reporting numbers DynamoDB cannot store"""
+    try:
+        return _SERIALIZER.serialize(value)
+    except DecimalException as e:
+        raise ToolError(
+            f"Attribute {name!r} contains a number DynamoDB cannot store: numbers must have "
+            "at most 38 significant digits and a magnitude between 1E-130 and "
+            "9.9999999999999999999999999999999999999E+125 (or be 0)"
+        ) from e
+
 def serialize_dynamodb_item(item):
     """Convert Python dict to DynamoDB format"""
     if isinstance(item, dict):
-        return {k: serialize_dynamodb_value(v) for k, v in item.items()}
+        return {k: serialize_attribute(k, v) for k, v in item.items()}
     return item
 
-def serialize_dynamodb_value(value):
-    """Convert Python value to DynamoDB attribute value"""
-    if isinstance(value, str):
-        return {'S': value}
-    elif isinstance(value, (int, float)):
-        return {'N': str(value)}
-    elif isinstance(value, bool):
-        return {'BOOL': value}
-    elif isinstance(value, list):
-        return {'L': [serialize_dynamodb_value(v) for v in value]}
-    elif isinstance(value, dict):
-        return {'M': {k: serialize_dynamodb_value(v) for k, v in value.items()}}
-    elif value is None:
-        return {'NULL': True}
-    return {'S': str(value)}
+def serialize_expression_values(values):
+    """Convert ExpressionAttributeValues to DynamoDB format, passing through values
+    the caller already wrote as AttributeValues"""
+    return {k: v if is_attribute_value(v) else serialize_attribute(k, v) for k, v in values.items()}
+
+def deserialize_dynamodb_item(item):
+    """Convert DynamoDB format dict to Python dict"""
+    return {k: _DESERIALIZER.deserialize(v) for k, v in item.items()}
+
+@functools.lru_cache(maxsize=256)
+def build_key_schema(partitionKey, partitionKeyType, sortKey=None, sortKeyType=None):
+    """Build (KeySchema, AttributeDefinitions) for a table or index.
+
+    Results are cached and shared between calls, so they are returned as tuples
+    (which boto3 accepts for list parameters) and must not be modified.
+    """
+    key_schema = ({'AttributeName': partitionKey, 'KeyType': 'HASH'},)
+    attribute_definitions = ({'AttributeName': partitionKey, 'AttributeType': partitionKeyType},)
+    if sortKey:
+        key_schema += ({'AttributeName': sortKey, 'KeyType': 'RANGE'},)
+        attribute_definitions += ({'AttributeName': sortKey, 'AttributeType': sortKeyType},)
+    return key_schema, attribute_definitions
 
 @mcp.tool()
-def list_tables(limit: Optional[int] = None, exclusiveStartTableName: Optional[str] = None) -> Dict[str, Any]:
+@handle_client_errors
+@ttl_cached
+async def list_tables(limit: Optional[int] = None, exclusiveStartTableName: Optional[str] = None) -> Dict[str, Any]:
     """Lists all DynamoDB tables in the account"""
-    try:
-        client = get_dynamodb_client()
-        params = {}
-        if limit:
-            params['Limit'] = limit
-        if exclusiveStartTableName:
-            params['ExclusiveStartTableName'] = exclusiveStartTableName
-        
-        response = client.list_tables(**params)
-        return {
-            "TableNames": response['TableNames'],
-            "LastEvaluatedTableName": response.get('LastEvaluatedTableName')
-        }
-    except ClientError as e:
-        return {"error": str(e)}
+    client = get_async_dynamodb_client()
+    params = {}
+    if limit:
+        params['Limit'] = limit
+    if exclusiveStartTableName:
+        params['ExclusiveStartTableName'] = exclusiveStartTableName
+    
+    response = await client.list_tables(**params)
+    return {
+        "TableNames": response['TableNames'],
+        "LastEvaluatedTableName": response.get('LastEvaluatedTableName')
+    }
 
 @mcp.tool()
-def describe_table(tableName: str) -> Dict[str, Any]:
+@handle_client_errors
+async def describe_table(tableName: str) -> Dict[str, Any]:
     """Gets detailed information about a DynamoDB table"""
-    try:
-        client = get_dynamodb_client()
-        response = client.describe_table(TableName=tableName)
-        return response['Table']
-    except ClientError as e:
-        return {"error": str(e)}
+    return await get_table_description(tableName)
 
 @mcp.tool()
-def create_table(tableName: str, partitionKey: str, partitionKeyType: str, 
+@handle_client_errors
+async def create_table(tableName: str, partitionKey: str, partitionKeyType: str, 
                 sortKey: Optional[str] = None, sortKeyType: Optional[str] = None,
                 readCapacity: int = 5, writeCapacity: int = 5) -> Dict[str, Any]:
     """Creates a new DynamoDB table with specified configuration"""
-    try:
-        client = get_dynamodb_client()
-        
-        # Build key schema
-        key_schema = [{'AttributeName': partitionKey, 'KeyType': 'HASH'}]
-        attribute_definitions = [{'AttributeName': partitionKey, 'AttributeType': partitionKeyType}]
-        
-        if sortKey:
-            key_schema.append({'AttributeName': sortKey, 'KeyType': 'RANGE'})
-            attribute_definitions.append({'AttributeName': sortKey, 'AttributeType': sortKeyType})
-        
-        params = {
-            'TableName': tableName,
-            'KeySchema': key_schema,
-            'AttributeDefinitions': attribute_definitions,
-            'BillingMode': 'PROVISIONED',
-            'ProvisionedThroughput': {
-                'ReadCapacityUnits': readCapacity,
-                'WriteCapacityUnits': writeCapacity
-            }
+    client = get_async_dynamodb_client()
+    key_schema, attribute_definitions = build_key_schema(partitionKey, partitionKeyType, sortKey, sortKeyType)
+    
+    params = {
+        'TableName': tableName,
+        'KeySchema': key_schema,
+        'AttributeDefinitions': attribute_definitions,
+        'BillingMode': 'PROVISIONED',
+        'ProvisionedThroughput': {
+            'ReadCapacityUnits': readCapacity,
+            'WriteCapacityUnits': writeCapacity
         }
-        
-        response = client.create_table(**params)
-        return {"status": "creating", "tableArn": response['TableDescription']['TableArn']}
-    except ClientError as e:
-        return {"error": str(e)}
+    }
+    
+    response = await client.create_table(**params)
+    invalidate_table_cache(tableName, include_listing=True)
+    return {"status": "creating", "tableArn": response['TableDescription']['TableArn']}
 
 @mcp.tool()
-def update_capacity(tableName: str, readCapacity: int, writeCapacity: int) -> Dict[str, Any]:
+@handle_client_errors
+async def update_capacity(tableName: str, readCapacity: int, writeCapacity: int) -> Dict[str, Any]:
     """Updates the provisioned capacity of a table"""
-    try:
-        client = get_dynamodb_client()
-        response = client.update_table(
-            TableName=tableName,
-            ProvisionedThroughput={
-                'ReadCapacityUnits': readCapacity,
-                'WriteCapacityUnits': writeCapacity
-            }
-        )
-        return {"status": "updating", "tableArn": response['TableDescription']['TableArn']}
-    except ClientError as e:
-        return {"error": str(e)}
+    client = get_async_dynamodb_client()
+    response = await client.update_table(
+        TableName=tableName,
+        ProvisionedThroughput={
+            'ReadCapacityUnits': readCapacity,
+            'WriteCapacityUnits': writeCapacity
+        }
+    )
+    invalidate_table_cache(tableName)
+    return {"status": "updating", "tableArn": response['TableDescription']['TableArn']}
 
 @mcp.tool()
-def put_item(tableName: str, item: Dict[str, Any]) -> Dict[str, Any]:
+@handle_client_errors
+async def put_item(tableName: str, item: Dict[str, Any]) -> Dict[str, Any]:
     """Inserts or replaces an item in a table"""
-    try:
-        client = get_dynamodb_client()
-        dynamodb_item = serialize_dynamodb_item(item)
-        response = client.put_item(
-            TableName=tableName,
-            Item=dynamodb_item
-        )
-        return {"status": "success"}
-    except ClientError as e:
-        return {"error": str(e)}
+    client = get_async_dynamodb_client()
+    dynamodb_item = serialize_dynamodb_item(item)
+    response = await client.put_item(
+        TableName=tableName,
+        Item=dynamodb_item
+    )
+    return {"status": "success"}
 
 @mcp.tool()
-def get_item(tableName: str, key: Dict[str, Any]) -> Dict[str, Any]:
+@handle_client_errors
+async def get_item(tableName: str, key: Dict[str, Any]) -> Dict[str, Any]:
     """Retrieves an item from a table by its primary key"""
-    try:
-        client = get_dynamodb_client()
-        dynamodb_key = serialize_dynamodb_item(key)
-        response = client.get_item(
-            TableName=tableName,
-            Key=dynamodb_key
-        )
-        return response.get('Item', {})
-    except ClientError as e:
-        return {"error": str(e)}
+    client = get_async_dynamodb_client()
+    dynamodb_key = serialize_dynamodb_item(key)
+    response = await client.get_item(
+        TableName=tableName,
+        Key=dynamodb_key
+    )
+    return deserialize_dynamodb_item(response.get('Item', {}))
 
 @mcp.tool()
-def update_item(tableName: str, key: Dict[str, Any], updateExpression: str,
+@handle_client_errors
+async def update_item(tableName: str, key: Dict[str, Any], updateExpression: str,
                expressionAttributeNames: Dict[str, str], expressionAttributeValues: Dict[str, Any],
                conditionExpression: Optional[str] = None, returnValues: str = "ALL_NEW") -> Dict[str, Any]:
     """Updates specific attributes of an item in a table"""
-    try:
-        client = get_dynamodb_client()
-        dynamodb_key = serialize_dynamodb_item(key)
-        dynamodb_values = serialize_dynamodb_item(expressionAttributeValues)
-        
-        params = {
-            'TableName': tableName,
-            'Key': dynamodb_key,
-            'UpdateExpression': updateExpression,
-            'ExpressionAttributeNames': expressionAttributeNames,
-            'ExpressionAttributeValues': dynamodb_values,
-            'ReturnValues': returnValues
-        }
-        
-        if conditionExpression:
-            params['ConditionExpression'] = conditionExpression
-        
-        response = client.update_item(**params)
-        return response.get('Attributes', {})
-    except ClientError as e:
-        return {"error": str(e)}
+    client = get_async_dynamodb_client()
+    dynamodb_key = serialize_dynamodb_item(key)
+    dynamodb_values = serialize_expression_values(expressionAttributeValues)
+    
+    params = {
+        'TableName': tableName,
+        'Key': dynamodb_key,
+        'UpdateExpression': updateExpression,
+        'ExpressionAttributeNames': expressionAttributeNames,
+        'ExpressionAttributeValues': dynamodb_values,
+        'ReturnValues': returnValues
+    }
+    
+    if conditionExpression:
+        params['ConditionExpression'] = conditionExpression
+    
+    response = await client.update_item(**params)
+    return deserialize_dynamodb_item(response.get('Attributes', {}))
+
+@mcp.tool()
+@handle_client_errors
+async def batch_put_items(tableName: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Inserts or replaces multiple items in a table using batched writes,
+    paced to the table's provisioned write capacity"""
+    if not items:
+        return {"status": "success", "written": 0, "unprocessed": 0}
+    client = get_async_dynamodb_client()
+    bucket = await get_write_bucket(tableName)
+    written = 0
+    unprocessed = 0
+    for chunk in chunked(items, _BATCH_WRITE_SIZE):
+        try:
+            request_items = {
+                tableName: [{'PutRequest': {'Item': serialize_dynamodb_item(item)}} for item in chunk]
+            }
+            _, remaining = await retry_unprocessed(
+                client.batch_write_item, request_items, 'UnprocessedItems', bucket
+            )
+        except (ClientError, ToolError) as e:
+            # Earlier chunks are already stored; tell the caller how far we got
+            message = format_client_error(e) if isinstance(e, ClientError) else str(e)
+            raise ToolError(
+                f"{message} ({written} of {len(items)} items were written before this failure, "
+                f"{unprocessed} left unprocessed)"
+            ) from e
+        chunk_unprocessed = len(remaining.get(tableName, []))
+        written += len(chunk) - chunk_unprocessed
+        unprocessed += chunk_unprocessed
+    return {"status": "success", "written": written, "unprocessed": unprocessed}
+
+@mcp.tool()
+@handle_client_errors
+async def batch_get_items(tableName: str, keys: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Retrieves multiple items from a table by their primary keys using batched reads"""
+    client = get_async_dynamodb_client()
+    items = []
+    unprocessed = 0
+    for chunk in chunked(keys, _BATCH_GET_SIZE):
+        request_items = {tableName: {'Keys': [serialize_dynamodb_item(key) for key in chunk]}}
+        responses, remaining = await retry_unprocessed(client.batch_get_item, request_items, 'UnprocessedKeys')
+        for response in responses:
+            items.extend(
+                deserialize_dynamodb_item(item)
+                for item in response.get('Responses', {}).get(tableName, [])
+            )
+        unprocessed += len(remaining.get(tableName, {}).get('Keys', []))
+    return {"Items": items, "Count": len(items), "unprocessed": unprocessed}
 
 
+def build_scan_params(tableName, filterExpression=None, expressionAttributeValues=None,
+                      expressionAttributeNames=None):
+    """Build the common Scan request parameters"""
+    params = {'TableName': tableName}
+    if filterExpression:
+        params['FilterExpression'] = filterExpression
+    if expressionAttributeValues:
+        params['ExpressionAttributeValues'] = serialize_expression_values(expressionAttributeValues)
+    if expressionAttributeNames:
+        params['ExpressionAttributeNames'] = expressionAttributeNames
+    return params
 
 @mcp.tool()
-def scan_table(tableName: str, filterExpression: Optional[str] = None,
+@handle_client_errors
+async def scan_table(tableName: str, filterExpression: Optional[str] = None,
               expressionAttributeValues: Optional[Dict[str, Any]] = None,
               expressionAttributeNames: Optional[Dict[str, str]] = None,
-              limit: Optional[int] = None) -> Dict[str, Any]:
-    """Scans an entire table with optional filters"""
-    try:
-        client = get_dynamodb_client()
-        params = {'TableName': tableName}
-        
-        if filterExpression:
-            params['FilterExpression'] = filterExpression
-        if expressionAttributeValues:
-            params['ExpressionAttributeValues'] = serialize_dynamodb_item(expressionAttributeValues)
-        if expressionAttributeNames:
-            params['ExpressionAttributeNames'] = expressionAttributeNames
-        if limit:
-            params['Limit'] = limit
-            
-        response = client.scan(**params)
-        return {
-            "Items": response.get('Items', []),
-            "Count": response.get('Count', 0),
-            "ScannedCount": response.get('ScannedCount', 0)
-        }
-    except ClientError as e:
-        return {"error": str(e)}
+              limit: Optional[int] = None, nextToken: Optional[str] = None,
+              format: Literal["items", "columnar"] = "items") -> Dict[str, Any]:
+    """Scans a table with optional filters, following pagination up to limit items
+    (default 1000); pass the returned NextToken to continue"""
+    params = build_scan_params(tableName, filterExpression,
+                               expressionAttributeValues, expressionAttributeNames)
+    response = await run_blocking(paginate_all, 'scan', params, limit, nextToken)
+    return format_items(response, format)
 
 @mcp.tool()
-def query_table(tableName: str, keyConditionExpression: str, expressionAttributeValues: Dict[str, Any],
+@handle_client_errors
+async def scan_table_parallel(tableName: str, totalSegments: int = 4,
+                       filterExpression: Optional[str] = None,
+                       expressionAttributeValues: Optional[Dict[str, Any]] = None,
+                       expressionAttributeNames: Optional[Dict[str, str]] = None,
+                       limit: Optional[int] = None,
+                       nextTokens: Optional[List[Optional[str]]] = None,
+                       format: Literal["items", "columnar"] = "items") -> Dict[str, Any]:
+    """Scans a table as totalSegments concurrent parallel-scan segments, returning up to
+    limit items (default 1000) split evenly across segments; pass the returned
+    NextTokens (one per segment, None once a segment is finished) to continue"""
+    if not 1 <= totalSegments <= _MAX_TOTAL_SEGMENTS:
+        raise ToolError(f"totalSegments must be between 1 and {_MAX_TOTAL_SEGMENTS}")
+    if limit is not None and limit < 1:
+        raise ToolError("limit must be at least 1")
+    if nextTokens is None:
+        pending = {i: None for i in range(totalSegments)}
+    elif len(nextTokens) != totalSegments:
+        raise ToolError("nextTokens must have one entry per segment")
+    else:
+        pending = {i: token for i, token in enumerate(nextTokens) if token is not None}
+    params = build_scan_params(tableName, filterExpression,
+                               expressionAttributeValues, expressionAttributeNames)
+    segment_limit = -(-(limit if limit is not None else _DEFAULT_ITEM_LIMIT) // max(len(pending), 1))
+    segments = await asyncio.gather(*(
+        scan_segment({**params, 'Segment': i, 'TotalSegments': totalSegments}, segment_limit, token)
+        for i, token in pending.items()
+    ))
+    next_tokens = [None] * totalSegments
+    for i, segment in zip(pending, segments):
+        next_tokens[i] = segment['NextToken']
+    items = list(chain.from_iterable(segment['Items'] for segment in segments))
+    return format_items({
+        "Items": items,
+        "Count": len(items),
+        "ScannedCount": sum(segment['ScannedCount'] for segment in segments),
+        "NextTokens": next_tokens if any(next_tokens) else None
+    }, format)
+
+@mcp.tool()
+@handle_client_errors
+async def query_table(tableName: str, keyConditionExpression: str, expressionAttributeValues: Dict[str, Any],
                expressionAttributeNames: Optional[Dict[str, str]] = None,
-               filterExpression: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
-    """Queries a table using key conditions and optional filters"""
-    try:
-        client = get_dynamodb_client()
-        params = {
-            'TableName': tableName,
-            'KeyConditionExpression': keyConditionExpression,
-            'ExpressionAttributeValues': serialize_dynamodb_item(expressionAttributeValues)
-        }
+               filterExpression: Optional[str] = None, limit: Optional[int] = None,
+               nextToken: Optional[str] = None,
+               format: Literal["items", "columnar"] = "items") -> Dict[str, Any]:
+    """Queries a table using key conditions and optional filters, following pagination up to
+    limit items (default 1000); pass the returned NextToken to continue"""
+    params = {
+        'TableName': tableName,
+        'KeyConditionExpression': keyConditionExpression,
+        'ExpressionAttributeValues': serialize_expression_values(expressionAttributeValues)
+    }
+    
+    if expressionAttributeNames:
+        params['ExpressionAttributeNames'] = expressionAttributeNames
+    if filterExpression:
+        params['FilterExpression'] = filterExpression
         
-        if expressionAttributeNames:
-            params['ExpressionAttributeNames'] = expressionAttributeNames
-        if filterExpression:
-            params['FilterExpression'] = filterExpression
-        if limit:
-            params['Limit'] = limit
-            
-        response = client.query(**params)
-        return {
-            "Items": response.get('Items', []),
-            "Count": response.get('Count', 0)
-        }
-    except ClientError as e:
-        return {"error": str(e)}
+    response = await run_blocking(paginate_all, 'query', params, limit, nextToken)
+    return format_items({
+        "Items": response['Items'],
+        "Count": response['Count'],
+        "NextToken": response['NextToken']
+    }, format)
 
 @mcp.tool()
-def create_gsi(tableName: str, indexName: str, partitionKey: str, partitionKeyType: str,
+@handle_client_errors
+async def create_gsi(tableName: str, indexName: str, partitionKey: str, partitionKeyType: str,
               sortKey: Optional[str] = None, sortKeyType: Optional[str] = None,
               projectionType: str = "ALL", nonKeyAttributes: Optional[List[str]] = None,
               readCapacity: int = 5, writeCapacity: int = 5) -> Dict[str, Any]:
     """Creates a global secondary index on a table"""
-    try:
-        client = get_dynamodb_client()
-        
-        # Build GSI key schema
-        key_schema = [{'AttributeName': partitionKey, 'KeyType': 'HASH'}]
-        attribute_definitions = [{'AttributeName': partitionKey, 'AttributeType': partitionKeyType}]
-        
-        if sortKey:
-            key_schema.append({'AttributeName': sortKey, 'KeyType': 'RANGE'})
-            attribute_definitions.append({'AttributeName': sortKey, 'AttributeType': sortKeyType})
-        
-        # Build projection
-        projection = {'ProjectionType': projectionType}
-        if projectionType == 'INCLUDE' and nonKeyAttributes:
-            projection['NonKeyAttributes'] = nonKeyAttributes
-        
-        gsi_spec = {
-            'IndexName': indexName,
-            'KeySchema': key_schema,
-            'Projection': projection,
-            'ProvisionedThroughput': {
-                'ReadCapacityUnits': readCapacity,
-                'WriteCapacityUnits': writeCapacity
-            }
+    client = get_async_dynamodb_client()
+    key_schema, attribute_definitions = build_key_schema(partitionKey, partitionKeyType, sortKey, sortKeyType)
+    
+    # Build projection
+    projection = {'ProjectionType': projectionType}
+    if projectionType == 'INCLUDE' and nonKeyAttributes:
+        projection['NonKeyAttributes'] = nonKeyAttributes
+    
+    gsi_spec = {
+        'IndexName': indexName,
+        'KeySchema': key_schema,
+        'Projection': projection,
+        'ProvisionedThroughput': {
+            'ReadCapacityUnits': readCapacity,
+            'WriteCapacityUnits': writeCapacity
         }
-        
-        response = client.update_table(
-            TableName=tableName,
-            AttributeDefinitions=attribute_definitions,
-            GlobalSecondaryIndexUpdates=[{'Create': gsi_spec}]
-        )
-        return {"status": "creating", "indexName": indexName}
-    except ClientError as e:
-        return {"error": str(e)}
+    }
+    
+    response = await client.update_table(
+        TableName=tableName,
+        AttributeDefinitions=attribute_definitions,
+        GlobalSecondaryIndexUpdates=[{'Create': gsi_spec}]
+    )
+    invalidate_table_cache(tableName)
+    return {"status": "creating", "indexName": indexName}
 
 @mcp.tool()
-def update_gsi(tableName: str, indexName: str, readCapacity: int, writeCapacity: int) -> Dict[str, Any]:
+@handle_client_errors
+async def update_gsi(tableName: str, indexName: str, readCapacity: int, writeCapacity: int) -> Dict[str, Any]:
     """Updates the provisioned capacity of a global secondary index"""
-    try:
-        client = get_dynamodb_client()
-        response = client.update_table(
-            TableName=tableName,
-            GlobalSecondaryIndexUpdates=[{
-                'Update': {
-                    'IndexName': indexName,
-                    'ProvisionedThroughput': {
-                        'ReadCapacityUnits': readCapacity,
-                        'WriteCapacityUnits': writeCapacity
-                    }
+    client = get_async_dynamodb_client()
+    response = await client.update_table(
+        TableName=tableName,
+        GlobalSecondaryIndexUpdates=[{
+            'Update': {
+                'IndexName': indexName,
+                'ProvisionedThroughput': {
+                    'ReadCapacityUnits': readCapacity,
+                    'WriteCapacityUnits': writeCapacity
                 }
-            }]
-        )
-        return {"status": "updating", "indexName": indexName}
-    except ClientError as e:
-        return {"error": str(e)}
+            }
+        }]
+    )
+    invalidate_table_cache(tableName)
+    return {"status": "updating", "indexName": indexName}
 
 @mcp.tool()
-def create_lsi(tableName: str, indexName: str, partitionKey: str, partitionKeyType: str,
+async def create_lsi(tableName: str, indexName: str, partitionKey: str, partitionKeyType: str,
               sortKey: str, sortKeyType: str, projectionType: str = "ALL",
               nonKeyAttributes: Optional[List[str]] = None, readCapacity: int = 5, writeCapacity: int = 5) -> Dict[str, Any]:
     """Creates a local secondary index on a table (must be done during table creation)"""
-    try:
-        # Note: LSI can only be created during table creation, not after
-        return {"error": "Local Secondary Indexes can only be created during table creation. Use create_table with LSI specification."}
-    except Exception as e:
-        return {"error": str(e)}
+    # Note: LSI can only be created during table creation, not after
+    raise ToolError("Local Secondary Indexes can only be created during table creation. Use create_table with LSI specification.")
 
-# Web interface for browser access
-@mcp.custom_route("/", methods=["GET"])
-async def web_interface(request):
-    from starlette.responses import HTMLResponse
-    html_content = """
+# Web interface for browser access (static, so encoded and hashed once at import)
+_HTML = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -423,14 +811,30 @@ async def web_interface(request):
     </script>
 </body>
 </html>
-    """
-    return HTMLResponse(content=html_content)
+""".encode('utf-8')
+_HTML_ETAG = '"%s"' % hashlib.md5(_HTML).hexdigest()
+_HTML_HEADERS = {'ETag': _HTML_ETAG, 'Cache-Control': 'public, max-age=300'}
+
+def etag_matches(if_none_match, etag):
+    """Check an If-None-Match header (tag list, weak W/ tags or *) against an ETag"""
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*' or tag.removeprefix('W/') == etag:
+            return True
+    return False
+
+@mcp.custom_route("/", methods=["GET"])
+async def web_interface(request):
+    if etag_matches(request.headers.get('if-none-match', ''), _HTML_ETAG):
+        return Response(status_code=304, headers=_HTML_HEADERS)
+    return HTMLResponse(content=_HTML, headers=_HTML_HEADERS)
+
+# Health check endpoint (constant body, encoded once)
+_HEALTH = json.dumps({"status": "healthy", "service": "dynamodb-mcp-server"}).encode('utf-8')
 
-# Health check endpoint
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request):
-    from starlette.responses import JSONResponse
-    return JSONResponse({"status": "healthy", "service": "dynamodb-mcp-server"})
+    return Response(content=_HEALTH, media_type="application/json")
 
 if __name__ == "__main__":
     print("🚀 DynamoDB MCP Server starting...")
@@ -0,0 +1,49 @@
+import asyncio
+
+import server
+
+
+def setup_function():
+    server._RESPONSE_CACHE.clear()
+
+
+def test_in_flight_result_is_not_cached_after_invalidation():
+    calls = []
+
+    @server.ttl_cached
+    async def get_table_description(tableName):
+        calls.append(tableName)
+        if len(calls) == 1:
+            # create/update lands while this describe is in flight
+            server.invalidate_table_cache(tableName)
+        return {'TableStatus': 'ACTIVE'}
+
+    async def run():
+        await get_table_description('t')
+        await get_table_description('t')
+
+    asyncio.run(run())
+    assert calls == ['t', 't']
+
+
+def test_unsettled_descriptions_are_not_cached():
+    statuses = iter(['CREATING', 'ACTIVE', 'UPDATING'])
+    calls = []
+
+    @server.ttl_cached(cacheable=server.is_table_settled)
+    async def describe(tableName):
+        calls.append(tableName)
+        return {'TableStatus': next(statuses)}
+
+    async def run():
+        return [(await describe('t'))['TableStatus'] for _ in range(3)]
+
+    assert asyncio.run(run()) == ['CREATING', 'ACTIVE', 'ACTIVE']
+    assert len(calls) == 2
+
+
+def test_creating_index_is_not_settled():
+    assert not server.is_table_settled({
+        'TableStatus': 'ACTIVE',
+        'GlobalSecondaryIndexes': [{'IndexStatus': 'CREATING'}],
+    })
@@ -0,0 +1,54 @@
+import pytest
+from fastmcp.exceptions import ToolError
+
+from server import deserialize_dynamodb_item, serialize_dynamodb_item, serialize_expression_values
+
+
+def test_bool_serializes_as_bool():
+    assert serialize_dynamodb_item({'on': True, 'off': False}) == {
+        'on': {'BOOL': True},
+        'off': {'BOOL': False},
+    }
+    assert deserialize_dynamodb_item({'on': {'BOOL': True}}) == {'on': True}
+
+
+@pytest.mark.parametrize('value, digits', [(0.1, '0.1'), (1.5, '1.5'), (1e-7, '1E-7'), (2.0, '2.0')])
+def test_float_round_trip(value, digits):
+    serialized = serialize_dynamodb_item({'f': value})
+    assert serialized == {'f': {'N': digits}}
+    assert deserialize_dynamodb_item(serialized) == {'f': value}
+
+
+def test_integers_stay_exact():
+    big = 123456789012345678901234567890
+    assert deserialize_dynamodb_item(serialize_dynamodb_item({'n': big})) == {'n': big}
+
+
+def test_high_precision_number_keeps_exact_digits():
+    digits = '12345678901234567890.5'
+    assert deserialize_dynamodb_item({'n': {'N': digits}}) == {'n': digits}
+
+
+def test_out_of_range_number_is_tool_error():
+    with pytest.raises(ToolError, match="'tiny'"):
+        serialize_dynamodb_item({'tiny': 1e-200})
+
+
+def test_sets():
+    serialized = serialize_dynamodb_item({'tags': {'a', 'b'}, 'scores': {1, 2}})
+    assert sorted(serialized['tags']['SS']) == ['a', 'b']
+    assert sorted(serialized['scores']['NS']) == ['1', '2']
+    deserialized = deserialize_dynamodb_item(serialized)
+    assert sorted(deserialized['tags']) == ['a', 'b']
+    assert sorted(deserialized['scores']) == [1, 2]
+
+
+def test_binary():
+    serialized = serialize_dynamodb_item({'b': b'\x00\x01', 'bs': {b'\x02'}})
+    assert serialized == {'b': {'B': b'\x00\x01'}, 'bs': {'BS': [b'\x02']}}
+    assert deserialize_dynamodb_item(serialized) == {'b': 'AAE=', 'bs': ['Ag==']}
+
+
+def test_attribute_value_pass_through_only_for_expression_values():
+    assert serialize_expression_values({':v': {'S': 'x'}}) == {':v': {'S': 'x'}}
+    assert serialize_dynamodb_item({'stock': {'S': 'low'}}) == {'stock': {'M': {'S': {'S': 'low'}}}}